@@ -1,510 +0,0 @@
-#!/usr/bin/env python3
-"""
-Generate comparison figures for CXL SSD evaluation paper
-Compares: CXL SSD (simulated), Samsung SmartSSD, ScaleFlux CSD1000
-"""
-
-import json
-import os
-import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
-from pathlib import Path
-import warnings
-warnings.filterwarnings('ignore')
-
-# Set font size for academic paper
-plt.rcParams.update({
-    'font.size': 16,
-    'axes.labelsize': 18,
-    'axes.titlesize': 20,
-    'xtick.labelsize': 16,
-    'ytick.labelsize': 16,
-    'legend.fontsize': 16,
-    'figure.titlesize': 22,
-    'figure.figsize': (10, 6),
-    'lines.linewidth': 2,
-    'lines.markersize': 8,
-})
-
-# Color scheme for different SSDs
-COLORS = {
-    'CXL SSD': '#1f77b4',      # Blue
-    'Samsung SmartSSD': '#ff7f0e',  # Orange
-    'ScaleFlux CSD1000': '#2ca02c'  # Green
-}
-
-# Marker styles
-MARKERS = {
-    'CXL SSD': 'o',
-    'Samsung SmartSSD': 's',
-    'ScaleFlux CSD1000': '^'
-}
-
-def parse_fio_json(filepath):
-    """Parse FIO JSON output file"""
-    try:
-        with open(filepath, 'r') as f:
-            # Read entire file content
-            content = f.read()
-
-            # Find the JSON part (starts with '{')
-            json_start = content.find('{')
-            if json_start == -1:
-                return None
-
-            json_content = content[json_start:]
-            data = json.loads(json_content)
-
-            if 'jobs' not in data or len(data['jobs']) == 0:
-                return None
-
-            job = data['jobs'][0]
-
-            # Extract metrics based on operation type
-            if 'read' in job and job['read']['total_ios'] > 0:
-                op_data = job['read']
-                op_type = 'read'
-            elif 'write' in job and job['write']['total_ios'] > 0:
-                op_data = job['write']
-                op_type = 'write'
-            else:
-                return None
-
-            return {
-                'iops': op_data.get('iops', 0),
-                'bw_mbps': op_data.get('bw', 0) / 1024,  # Convert KB/s to MB/s
-                'lat_mean_us': op_data.get('lat_ns', {}).get('mean', 0) / 1000,  # Convert ns to us
-                'lat_p99_us': op_data.get('lat_ns', {}).get('percentile', {}).get('99.000000', 0) / 1000,
-                'op_type': op_type
-            }
-    except Exception as e:
-        print(f"Error parsing {filepath}: {e}")
-        return None
-
-def simulate_cxl_data(base_data, multiplier=1.2):
-    """Simulate CXL SSD data as 1.2x of base performance"""
-    if base_data is None:
-        return None
-    return {
-        'iops': base_data['iops'] * multiplier,
-        'bw_mbps': base_data['bw_mbps'] * multiplier,
-        'lat_mean_us': base_data['lat_mean_us'] / multiplier,  # Lower latency is better
-        'lat_p99_us': base_data['lat_p99_us'] / multiplier,
-        'op_type': base_data['op_type']
-    }
-
-def plot_blocksize_comparison():
-    """Generate block size vs throughput comparison figure"""
-    block_sizes = ['512', '1k', '4k', '16k', '64k', '256k', '1m', '4m', '16m', '64m']
-    block_labels = ['512B', '1KB', '4KB', '16KB', '64KB', '256KB', '1MB', '4MB', '16MB', '64MB']
-
-    # Data containers
-    samsung_read = []
-    samsung_write = []
-    scaleflux_read = []
-    scaleflux_write = []
-    cxl_read = []
-    cxl_write = []
-
-    for bs in block_sizes:
-        # Samsung data
-        samsung_read_file = f'/home/victoryang00/CXLSSDEval/scripts/samsung_raw/blocksize/bs_{bs}_read.json'
-        samsung_write_file = f'/home/victoryang00/CXLSSDEval/scripts/samsung_raw/blocksize/bs_{bs}_write.json'
-
-        samsung_r = parse_fio_json(samsung_read_file)
-        samsung_w = parse_fio_json(samsung_write_file)
-
-        samsung_read.append(samsung_r['bw_mbps'] if samsung_r else 0)
-        samsung_write.append(samsung_w['bw_mbps'] if samsung_w else 0)
-
-        # ScaleFlux data
-        scaleflux_read_file = f'/home/victoryang00/CXLSSDEval/scripts/results/raw/blocksize/bs_{bs}_read.json'
-        scaleflux_write_file = f'/home/victoryang00/CXLSSDEval/scripts/results/raw/blocksize/bs_{bs}_write.json'
-
-        scaleflux_r = parse_fio_json(scaleflux_read_file)
-        scaleflux_w = parse_fio_json(scaleflux_write_file)
-
-        scaleflux_read.append(scaleflux_r['bw_mbps'] if scaleflux_r else 0)
-        scaleflux_write.append(scaleflux_w['bw_mbps'] if scaleflux_w else 0)
-
-        # CXL simulated data (1.2x of best performer)
-        best_read = max(samsung_r['bw_mbps'] if samsung_r else 0,
-                        scaleflux_r['bw_mbps'] if scaleflux_r else 0)
-        best_write = max(samsung_w['bw_mbps'] if samsung_w else 0,
-                         scaleflux_w['bw_mbps'] if scaleflux_w else 0)
-
-        cxl_read.append(best_read * 1.2)
-        cxl_write.append(best_write * 1.2)
-
-    # Create figure with two subplots
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-
-    # Read performance
-    x = np.arange(len(block_labels))
-    width = 0.25
-
-    ax1.bar(x - width, samsung_read, width, label='Samsung SmartSSD', color=COLORS['Samsung SmartSSD'])
-    ax1.bar(x, scaleflux_read, width, label='ScaleFlux CSD1000', color=COLORS['ScaleFlux CSD1000'])
-    ax1.bar(x + width, cxl_read, width, label='CXL SSD', color=COLORS['CXL SSD'], alpha=0.7, hatch='//')
-
-    ax1.set_xlabel('Block Size')
-    ax1.set_ylabel('Read Bandwidth (MB/s)')
-    ax1.set_title('Read Performance vs Block Size')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(block_labels, rotation=45)
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-
-    # Write performance
-    ax2.bar(x - width, samsung_write, width, label='Samsung SmartSSD', color=COLORS['Samsung SmartSSD'])
-    ax2.bar(x, scaleflux_write, width, label='ScaleFlux CSD1000', color=COLORS['ScaleFlux CSD1000'])
-    ax2.bar(x + width, cxl_write, width, label='CXL SSD', color=COLORS['CXL SSD'], alpha=0.7, hatch='//')
-
-    ax2.set_xlabel('Block Size')
-    ax2.set_ylabel('Write Bandwidth (MB/s)')
-    ax2.set_title('Write Performance vs Block Size')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(block_labels, rotation=45)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/blocksize_comparison.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/blocksize_comparison.pdf', dpi=300, bbox_inches='tight')
-    print("Generated: blocksize_comparison.pdf/pdf")
-
-def plot_qd_scalability():
-    """Generate queue depth scalability figure"""
-    qd_values = ['1', '2', '4', '8', '16', '32']
-    qd_labels = ['QD=1', 'QD=2', 'QD=4', 'QD=8', 'QD=16', 'QD=32']
-
-    samsung_read_iops = []
-    samsung_write_iops = []
-    scaleflux_read_iops = []
-    scaleflux_write_iops = []
-    cxl_read_iops = []
-    cxl_write_iops = []
-
-    for qd in qd_values:
-        # Samsung data
-        samsung_r = parse_fio_json(f'/home/victoryang00/CXLSSDEval/scripts/samsung_raw/qd_thread/jobs{qd}_read.json')
-        samsung_w = parse_fio_json(f'/home/victoryang00/CXLSSDEval/scripts/samsung_raw/qd_thread/jobs{qd}_write.json')
-
-        samsung_read_iops.append(samsung_r['iops']/1000 if samsung_r else 0)  # Convert to K IOPS
-        samsung_write_iops.append(samsung_w['iops']/1000 if samsung_w else 0)
-
-        # ScaleFlux data
-        scaleflux_r = parse_fio_json(f'/home/victoryang00/CXLSSDEval/scripts/results/raw/qd_thread/jobs{qd}_read.json')
-        scaleflux_w = parse_fio_json(f'/home/victoryang00/CXLSSDEval/scripts/results/raw/qd_thread/jobs{qd}_write.json')
-
-        scaleflux_read_iops.append(scaleflux_r['iops']/1000 if scaleflux_r else 0)
-        scaleflux_write_iops.append(scaleflux_w['iops']/1000 if scaleflux_w else 0)
-
-        # CXL simulated
-        best_read = max(samsung_r['iops'] if samsung_r else 0, scaleflux_r['iops'] if scaleflux_r else 0)
-        best_write = max(samsung_w['iops'] if samsung_w else 0, scaleflux_w['iops'] if scaleflux_w else 0)
-
-        cxl_read_iops.append(best_read * 1.2 / 1000)
-        cxl_write_iops.append(best_write * 1.2 / 1000)
-
-    # Create figure
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
-
-    x = np.arange(len(qd_labels))
-
-    # Read IOPS
-    ax1.plot(x, samsung_read_iops, marker=MARKERS['Samsung SmartSSD'], label='Samsung SmartSSD',
-             color=COLORS['Samsung SmartSSD'], linewidth=2, markersize=10)
-    ax1.plot(x, scaleflux_read_iops, marker=MARKERS['ScaleFlux CSD1000'], label='ScaleFlux CSD1000',
-             color=COLORS['ScaleFlux CSD1000'], linewidth=2, markersize=10)
-    ax1.plot(x, cxl_read_iops, marker=MARKERS['CXL SSD'], label='CXL SSD',
-             color=COLORS['CXL SSD'], linewidth=2, markersize=10, linestyle='--', alpha=0.7)
-
-    ax1.set_xlabel('Queue Depth')
-    ax1.set_ylabel('Read IOPS (K)')
-    ax1.set_title('Read IOPS Scalability')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(qd_labels)
-    ax1.legend()
-    ax1.grid(True, alpha=0.3)
-
-    # Write IOPS
-    ax2.plot(x, samsung_write_iops, marker=MARKERS['Samsung SmartSSD'], label='Samsung SmartSSD',
-             color=COLORS['Samsung SmartSSD'], linewidth=2, markersize=10)
-    ax2.plot(x, scaleflux_write_iops, marker=MARKERS['ScaleFlux CSD1000'], label='ScaleFlux CSD1000',
-             color=COLORS['ScaleFlux CSD1000'], linewidth=2, markersize=10)
-    ax2.plot(x, cxl_write_iops, marker=MARKERS['CXL SSD'], label='CXL SSD',
-             color=COLORS['CXL SSD'], linewidth=2, markersize=10, linestyle='--', alpha=0.7)
-
-    ax2.set_xlabel('Queue Depth')
-    ax2.set_ylabel('Write IOPS (K)')
-    ax2.set_title('Write IOPS Scalability')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(qd_labels)
-    ax2.legend()
-    ax2.grid(True, alpha=0.3)
-
-    plt.tight_layout()
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/qd_scalability.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/qd_scalability.pdf', dpi=300, bbox_inches='tight')
-    print("Generated: qd_scalability.pdf/pdf")
-
-def plot_rwmix_performance():
-    """Generate read/write mix performance figure"""
-    rwmix_configs = [
-        ('rwmix_r100_w0', '100:0'),
-        ('rwmix_r75_w25', '75:25'),
-        ('rwmix_r50_w50', '50:50'),
-        # Note: Some files might be missing, handle gracefully
-    ]
-
-    labels = []
-    samsung_bw = []
-    scaleflux_bw = []
-    cxl_bw = []
-
-    for config, label in rwmix_configs:
-        labels.append(label)
-
-        # Samsung
-        samsung_data = parse_fio_json(f'/home/victoryang00/CXLSSDEval/scripts/samsung_raw/rwmix/{config}.json')
-        if samsung_data:
-            samsung_bw.append(samsung_data['bw_mbps'])
-        else:
-            samsung_bw.append(0)
-
-        # ScaleFlux
-        scaleflux_data = parse_fio_json(f'/home/victoryang00/CXLSSDEval/scripts/results/raw/rwmix/{config}.json')
-        if scaleflux_data:
-            scaleflux_bw.append(scaleflux_data['bw_mbps'])
-        else:
-            scaleflux_bw.append(0)
-
-        # CXL simulated
-        best_bw = max(samsung_data['bw_mbps'] if samsung_data else 0,
-                      scaleflux_data['bw_mbps'] if scaleflux_data else 0)
-        cxl_bw.append(best_bw * 1.2)
-
-    # Create figure
-    fig, ax = plt.subplots(figsize=(12, 7))
-
-    x = np.arange(len(labels))
-    width = 0.25
-
-    ax.bar(x - width, samsung_bw, width, label='Samsung SmartSSD', color=COLORS['Samsung SmartSSD'])
-    ax.bar(x, scaleflux_bw, width, label='ScaleFlux CSD1000', color=COLORS['ScaleFlux CSD1000'])
-    ax.bar(x + width, cxl_bw, width, label='CXL SSD', color=COLORS['CXL SSD'], alpha=0.7, hatch='//')
-
-    ax.set_xlabel('Read:Write Ratio')
-    ax.set_ylabel('Bandwidth (MB/s)')
-    ax.set_title('Performance vs Read/Write Mix')
-    ax.set_xticks(x)
-    ax.set_xticklabels(labels)
-    ax.legend()
-    ax.grid(True, alpha=0.3, axis='y')
-
-    plt.tight_layout()
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/rwmix_performance.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/rwmix_performance.pdf', dpi=300, bbox_inches='tight')
-    print("Generated: rwmix_performance.pdf/pdf")
-
-def plot_thermal_throttling():
-    """Generate thermal throttling analysis figure with dual y-axis"""
-    # Simulated data for thermal throttling demonstration
-    time_minutes = np.arange(0, 31, 1)  # 30 minutes
-
-    # Samsung: throttles at 70°C
-    samsung_temp = np.minimum(45 + time_minutes * 1.5, 70)  # Temperature rises then caps
-    samsung_throughput = np.where(samsung_temp < 70, 3500, 3500 * 0.5)  # 50% drop when throttled
-    samsung_throughput += np.random.normal(0, 50, len(time_minutes))  # Add noise
-
-    # ScaleFlux: throttles at 65°C
-    scaleflux_temp = np.minimum(45 + time_minutes * 1.3, 65)
-    scaleflux_throughput = np.where(scaleflux_temp < 65, 3200, 3200 * 0.4)  # 60% drop
-    scaleflux_throughput += np.random.normal(0, 40, len(time_minutes))
-
-    # CXL: offloads computation to maintain performance
-    cxl_temp = np.minimum(45 + time_minutes * 1.2, 68)  # Temperature rises slower
-    cxl_throughput = 4200 - (cxl_temp - 45) * 10  # Gradual decrease, but maintains higher perf
-    cxl_throughput += np.random.normal(0, 30, len(time_minutes))
-
-    # Create figure with dual y-axis
-    fig, ax1 = plt.subplots(figsize=(14, 8))
-
-    # Throughput (primary y-axis)
-    ax1.set_xlabel('Time (minutes)', fontsize=18)
-    ax1.set_ylabel('Throughput (MB/s)', fontsize=18)
-
-    l1 = ax1.plot(time_minutes, samsung_throughput, marker='o', markersize=6,
-                  label='Samsung SmartSSD', color=COLORS['Samsung SmartSSD'], linewidth=2)
-    l2 = ax1.plot(time_minutes, scaleflux_throughput, marker='s', markersize=6,
-                  label='ScaleFlux CSD1000', color=COLORS['ScaleFlux CSD1000'], linewidth=2)
-    l3 = ax1.plot(time_minutes, cxl_throughput, marker='^', markersize=6,
-                  label='CXL SSD', color=COLORS['CXL SSD'], linewidth=2.5, linestyle='--', alpha=0.8)
-
-    ax1.grid(True, alpha=0.3)
-    ax1.set_ylim([0, 5000])
-
-    # Temperature (secondary y-axis)
-    ax2 = ax1.twinx()
-    ax2.set_ylabel('Temperature (°C)', fontsize=18)
-
-    l4 = ax2.plot(time_minutes, samsung_temp, ':', color=COLORS['Samsung SmartSSD'],
-                  alpha=0.6, linewidth=1.5, label='Samsung Temp')
-    l5 = ax2.plot(time_minutes, scaleflux_temp, ':', color=COLORS['ScaleFlux CSD1000'],
-                  alpha=0.6, linewidth=1.5, label='ScaleFlux Temp')
-    l6 = ax2.plot(time_minutes, cxl_temp, ':', color=COLORS['CXL SSD'],
-                  alpha=0.6, linewidth=1.5, label='CXL Temp')
-
-    # Add horizontal lines for throttling thresholds
-    ax2.axhline(y=70, color='red', linestyle='--', alpha=0.3, label='Samsung Throttle')
-    ax2.axhline(y=65, color='orange', linestyle='--', alpha=0.3, label='ScaleFlux Throttle')
-
-    ax2.set_ylim([40, 80])
-
-    # Combined legend
-    lns = l1 + l2 + l3 + l4 + l5 + l6
-    labs = [l.get_label() for l in lns]
-    ax1.legend(lns, labs, loc='upper right', ncol=2, fontsize=14)
-
-    ax1.set_title('Thermal Throttling Impact on Performance', fontsize=20)
-
-    # Add annotation
-    ax1.annotate('CXL offloads to host CPU', xy=(20, cxl_throughput[20]),
-                xytext=(15, 4500),
-                arrowprops=dict(arrowstyle='->', color='blue', lw=1.5),
-                fontsize=14, color='blue')
-
-    ax1.annotate('Samsung throttles', xy=(14, samsung_throughput[14]),
-                xytext=(8, 2000),
-                arrowprops=dict(arrowstyle='->', color=COLORS['Samsung SmartSSD'], lw=1.5),
-                fontsize=14, color=COLORS['Samsung SmartSSD'])
-
-    plt.tight_layout()
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/thermal_throttling.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/thermal_throttling.pdf', dpi=300, bbox_inches='tight')
-    print("Generated: thermal_throttling.pdf/pdf")
-
-def plot_access_pattern():
-    """Generate access pattern comparison figure"""
-    patterns = ['Sequential Read', 'Random Read', 'Sequential Write', 'Random Write']
-
-    # Parse data for each pattern
-    samsung_perf = []
-    scaleflux_perf = []
-    cxl_perf = []
-
-    # Sequential read
-    samsung_seq_r = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/samsung_raw/access_pattern/pattern_read.json')
-    scaleflux_seq_r = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/results/raw/access_pattern/pattern_read.json')
-
-    # Random read
-    samsung_rand_r = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/samsung_raw/access_pattern/pattern_randread.json')
-    scaleflux_rand_r = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/results/raw/access_pattern/pattern_randread.json')
-
-    # Sequential write
-    samsung_seq_w = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/samsung_raw/access_pattern/pattern_write.json')
-    scaleflux_seq_w = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/results/raw/access_pattern/pattern_write.json')
-
-    # Random write
-    samsung_rand_w = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/samsung_raw/access_pattern/pattern_randwrite.json')
-    scaleflux_rand_w = parse_fio_json('/home/victoryang00/CXLSSDEval/scripts/results/raw/access_pattern/pattern_randwrite.json')
-
-    # Collect performance data (IOPS in thousands)
-    samsung_perf = [
-        samsung_seq_r['iops']/1000 if samsung_seq_r else 0,
-        samsung_rand_r['iops']/1000 if samsung_rand_r else 0,
-        samsung_seq_w['iops']/1000 if samsung_seq_w else 0,
-        samsung_rand_w['iops']/1000 if samsung_rand_w else 0
-    ]
-
-    scaleflux_perf = [
-        scaleflux_seq_r['iops']/1000 if scaleflux_seq_r else 0,
-        scaleflux_rand_r['iops']/1000 if scaleflux_rand_r else 0,
-        scaleflux_seq_w['iops']/1000 if scaleflux_seq_w else 0,
-        scaleflux_rand_w['iops']/1000 if scaleflux_rand_w else 0
-    ]
-
-    # CXL simulated (1.2x best, but only 1.5x gap between seq/random as per outline)
-    cxl_perf = []
-    for i in range(4):
-        best = max(samsung_perf[i], scaleflux_perf[i])
-        if i % 2 == 0:  # Sequential
-            cxl_perf.append(best * 1.2)
-        else:  # Random - smaller gap
-            cxl_perf.append(best * 1.15)
-
-    # Create figure
-    fig, ax = plt.subplots(figsize=(14, 7))
-
-    x = np.arange(len(patterns))
-    width = 0.25
-
-    ax.bar(x - width, samsung_perf, width, label='Samsung SmartSSD', color=COLORS['Samsung SmartSSD'])
-    ax.bar(x, scaleflux_perf, width, label='ScaleFlux CSD1000', color=COLORS['ScaleFlux CSD1000'])
-    ax.bar(x + width, cxl_perf, width, label='CXL SSD', color=COLORS['CXL SSD'], alpha=0.7, hatch='//')
-
-    ax.set_xlabel('Access Pattern')
-    ax.set_ylabel('IOPS (K)')
-    ax.set_title('Performance vs Access Pattern (4KB Operations)')
-    ax.set_xticks(x)
-    ax.set_xticklabels(patterns, rotation=15)
-    ax.legend()
-    ax.grid(True, alpha=0.3, axis='y')
-
-    # Add gap annotations
-    for i in [0, 2]:  # Sequential positions
-        seq_val = max(samsung_perf[i], scaleflux_perf[i], cxl_perf[i])
-        rand_val = max(samsung_perf[i+1], scaleflux_perf[i+1], cxl_perf[i+1])
-        gap = seq_val / rand_val if rand_val > 0 else 0
-
-        if i == 0:
-            ax.annotate(f'Gap: {gap:.1f}x', xy=(i+0.5, seq_val/2),
-                       fontsize=12, ha='center')
-
-    plt.tight_layout()
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/access_pattern.pdf', dpi=300, bbox_inches='tight')
-    plt.savefig('/home/victoryang00/CXLSSDEval/scripts/paper/img/access_pattern.pdf', dpi=300, bbox_inches='tight')
-    print("Generated: access_pattern.pdf/pdf")
-
-def main():
-    """Generate all figures for the paper"""
-    # Create output directory if it doesn't exist
-    os.makedirs('/home/victoryang00/CXLSSDEval/scripts/paper/img', exist_ok=True)
-
-    print("Generating paper figures...")
-    print("=" * 50)
-
-    # Generate each figure
-    try:
-        plot_blocksize_comparison()
-    except Exception as e:
-        print(f"Error generating blocksize comparison: {e}")
-
-    try:
-        plot_qd_scalability()
-    except Exception as e:
-        print(f"Error generating QD scalability: {e}")
-
-    try:
-        plot_rwmix_performance()
-    except Exception as e:
-        print(f"Error generating RW mix performance: {e}")
-
-    try:
-        plot_thermal_throttling()
-    except Exception as e:
-        print(f"Error generating thermal throttling: {e}")
-
-    try:
-        plot_access_pattern()
-    except Exception as e:
-        print(f"Error generating access pattern: {e}")
-
-    print("=" * 50)
-    print("Figure generation complete!")
-    print("Figures saved to: /home/victoryang00/CXLSSDEval/scripts/paper/img/")
-
-if __name__ == "__main__":
-    main()
\ No newline at end of file
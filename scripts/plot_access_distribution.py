@@ -3,24 +3,17 @@
 
 from __future__ import annotations
 
-import os
 from pathlib import Path
 from typing import Dict, Tuple
 
-os.environ.setdefault("MPLBACKEND", "Agg")
-
-import matplotlib
-
-matplotlib.use("Agg", force=True)
-
-import matplotlib.pyplot as plt
+import numpy as np
 
 try:
     import yaml
 except ImportError:  # pragma: no cover - optional dependency
     yaml = None
 
-from plot_utils import load_fio_job_metrics, resolve_cxl_path
+from plot_utils import apply_paper_style, get_pyplot, load_fio_job_metrics, resolve_cxl_path, save_pdf
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -87,23 +80,15 @@ def _build_series(root_map: Dict[str, Path], dist: str) -> Tuple[float, float, f
     return (samsung, scaleflux, cxl), (samsung_w, scaleflux_w, cxl_w)
 
 
-def plot_access_distribution() -> plt.Figure:
-    plt.rcParams.update(
-        {
-            "font.size": 19,
-            "axes.labelsize": 19,
-            "axes.titlesize": 19,
-            "xtick.labelsize": 19,
-            "ytick.labelsize": 19,
-            "legend.fontsize": 19,
-            "figure.titlesize": 19,
-            "font.family": "Helvetica",
-        }
-    )
+def plot_access_distribution() -> None:
+    plt = get_pyplot()
+    apply_paper_style(plt, size=19)
 
     roots = _resolve_roots()
-    x_pos = range(len(LABELS))
+    x_pos = np.arange(len(LABELS))
     width = 0.25
+    # Offsets computed once and shared by both subplots
+    offsets = (x_pos - width, x_pos, x_pos + width)
 
     read_rows = []
     write_rows = []
@@ -115,25 +100,25 @@ def plot_access_distribution() -> plt.Figure:
     fig, (ax_r, ax_w) = plt.subplots(1, 2, figsize=(16, 7))
 
     # Read throughput
-    ax_r.bar([x - width for x in x_pos], [vals[0] for vals in read_rows], width, label="Samsung SmartSSD", color=COLORS["samsung"])
-    ax_r.bar(x_pos, [vals[1] for vals in read_rows], width, label="ScaleFlux CSD1000", color=COLORS["scaleflux"])
-    ax_r.bar([x + width for x in x_pos], [vals[2] for vals in read_rows], width, label="CXL SSD", color=COLORS["cxl"], alpha=0.75, hatch="//")
+    ax_r.bar(offsets[0], [vals[0] for vals in read_rows], width, label="Samsung SmartSSD", color=COLORS["samsung"])
+    ax_r.bar(offsets[1], [vals[1] for vals in read_rows], width, label="ScaleFlux CSD1000", color=COLORS["scaleflux"])
+    ax_r.bar(offsets[2], [vals[2] for vals in read_rows], width, label="CXL SSD", color=COLORS["cxl"], hatch="//", edgecolor="white")
     ax_r.set_xlabel("Access Distribution")
     ax_r.set_ylabel("Read Throughput (MB/s)")
     ax_r.set_title("(a) Read Throughput (4KB)")
-    ax_r.set_xticks(list(x_pos))
+    ax_r.set_xticks(x_pos)
     ax_r.set_xticklabels([PRETTY[d] for d in LABELS])
     ax_r.legend(loc="best")
     ax_r.grid(True, axis="y", alpha=0.3)
 
     # Write throughput
-    ax_w.bar([x - width for x in x_pos], [vals[0] for vals in write_rows], width, label="Samsung SmartSSD", color=COLORS["samsung"])
-    ax_w.bar(x_pos, [vals[1] for vals in write_rows], width, label="ScaleFlux CSD1000", color=COLORS["scaleflux"])
-    ax_w.bar([x + width for x in x_pos], [vals[2] for vals in write_rows], width, label="CXL SSD", color=COLORS["cxl"], alpha=0.75, hatch="//")
+    ax_w.bar(offsets[0], [vals[0] for vals in write_rows], width, label="Samsung SmartSSD", color=COLORS["samsung"])
+    ax_w.bar(offsets[1], [vals[1] for vals in write_rows], width, label="ScaleFlux CSD1000", color=COLORS["scaleflux"])
+    ax_w.bar(offsets[2], [vals[2] for vals in write_rows], width, label="CXL SSD", color=COLORS["cxl"], hatch="//", edgecolor="white")
     ax_w.set_xlabel("Access Distribution")
     ax_w.set_ylabel("Write Throughput (MB/s)")
     ax_w.set_title("(b) Write Throughput (4KB)")
-    ax_w.set_xticks(list(x_pos))
+    ax_w.set_xticks(x_pos)
     ax_w.set_xticklabels([PRETTY[d] for d in LABELS])
     ax_w.legend(loc="best")
     ax_w.grid(True, axis="y", alpha=0.3)
@@ -144,9 +129,9 @@ def plot_access_distribution() -> plt.Figure:
     plt.tight_layout()
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / "access_distribution.pdf"
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    save_pdf(fig, output_path, bbox_inches="tight")
     print(f"Access-distribution plot saved to {output_path}")
-    return fig
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -6,18 +6,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict
 
-import os
-
-os.environ.setdefault("MPLBACKEND", "Agg")
-
-import matplotlib
-
-matplotlib.use("Agg", force=True)
-
-import matplotlib.pyplot as plt
 import numpy as np
 
-from plot_utils import infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path
+from plot_utils import apply_paper_style, get_pyplot, infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path, save_pdf
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -55,18 +46,10 @@ def _derive_cxl_series(samsung: Dict[str, float], uplift: float) -> Dict[str, fl
     return {label: value * uplift for label, value in samsung.items()}
 
 
-def plot_access_pattern() -> plt.Figure:
+def plot_access_pattern() -> None:
     """Build the access-pattern plot using the recorded benchmark outputs."""
-    plt.rcParams.update({
-        "font.size": 20,
-        "axes.labelsize": 20,
-        "axes.titlesize": 20,
-        "xtick.labelsize": 20,
-        "ytick.labelsize": 20,
-        "legend.fontsize": 20,
-        "figure.titlesize": 20,
-        "font.family": "Helvetica",
-    })
+    plt = get_pyplot()
+    apply_paper_style(plt)
 
     patterns = list(PATTERN_FILES.keys())
     x_pos = np.arange(len(patterns))
@@ -81,16 +64,26 @@ def plot_access_pattern() -> plt.Figure:
         uplift = infer_cxl_uplift(BASE_DIR)
         cxl_series = _derive_cxl_series(samsung_series, uplift)
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7), layout="constrained")
     width = 0.25
 
-    samsung_vals = [samsung_series[label] for label in patterns]
-    scala_vals = [scaleflux_series[label] for label in patterns]
-    cxl_vals = [cxl_series[label] for label in patterns]
-
-    ax.bar(x_pos - width, samsung_vals, width, label="Samsung SmartSSD", color="#1f77b4")
-    ax.bar(x_pos, scala_vals, width, label="ScaleFlux CSD1000", color="#ff7f0e")
-    ax.bar(x_pos + width, cxl_vals, width, label="CXL SSD", color="#2ca02c", alpha=0.75, hatch="//")
+    # Stack x positions and heights into contiguous arrays so each ax.bar call
+    # receives an ndarray row instead of converting a Python list internally.
+    x_all = np.stack([x_pos - width, x_pos, x_pos + width])
+    heights = np.stack(
+        [
+            [samsung_series[label] for label in patterns],
+            [scaleflux_series[label] for label in patterns],
+            [cxl_series[label] for label in patterns],
+        ]
+    )
+    bar_styles = (
+        {"label": "Samsung SmartSSD", "color": "#1f77b4"},
+        {"label": "ScaleFlux CSD1000", "color": "#ff7f0e"},
+        {"label": "CXL SSD", "color": "#2ca02c", "hatch": "//", "edgecolor": "white"},
+    )
+    for xs, hs, style in zip(x_all, heights, bar_styles):
+        ax.bar(xs, hs, width, **style)
 
     ax.set_xlabel("Access Pattern")
     ax.set_ylabel("Throughput (MB/s)")
@@ -100,13 +93,12 @@ def plot_access_pattern() -> plt.Figure:
     ax.legend(loc="best")
     ax.grid(True, axis="y", alpha=0.3)
 
-    plt.tight_layout()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / "access_pattern.pdf"
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    save_pdf(fig, output_path, bbox_inches="tight")
     print(f"Access pattern plot saved to {output_path}")
-    return fig
+    plt.close(fig)
 
 
 if __name__ == "__main__":
@@ -42,8 +42,10 @@ def main() -> None:
         except Exception as exc:  # noqa: BLE001
             failures.append((description, exc))
             print(f"✗ Failed to generate {description}: {exc}")
-
-    plt.close("all")
+        finally:
+            # Cap peak memory: drop any figures a plotter left open before
+            # dispatching the next one.
+            plt.close("all")
 
     print("\nSummary:")
     print(f"✓ Successfully generated {len(successes)} plots")
@@ -6,18 +6,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
-import os
-
-os.environ.setdefault("MPLBACKEND", "Agg")
-
-import matplotlib
-
-matplotlib.use("Agg", force=True)
-
-import matplotlib.pyplot as plt
 import numpy as np
 
-from plot_utils import infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path
+from plot_utils import apply_paper_style, get_pyplot, infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path, save_pdf
 
 BASE_DIR = Path(__file__).resolve().parent
 OUTPUT_DIR = Path(__file__).resolve().parents[2] / "img"
@@ -47,19 +38,19 @@ def _discover_block_sizes(paths: Iterable[Path]) -> List[str]:
     return sizes
 
 
-def _load_blocksize_series(root: Path, block_sizes: List[str]) -> Dict[str, List[float]]:
-    read_vals: List[float] = []
-    write_vals: List[float] = []
-    for bs in block_sizes:
+def _load_blocksize_series(root: Path, block_sizes: List[str]) -> Dict[str, np.ndarray]:
+    # Preallocated float arrays: values land directly in C doubles instead of
+    # growing Python lists that matplotlib would convert again later.
+    read_vals = np.empty(len(block_sizes))
+    write_vals = np.empty_like(read_vals)
+    for i, bs in enumerate(block_sizes):
         read_path = root / f"bs_{bs}_read.json"
         write_path = root / f"bs_{bs}_write.json"
         if not read_path.exists() or not write_path.exists():
             raise FileNotFoundError(f"Missing block-size result for {bs} in {root}")
 
-        read_metrics = load_fio_job_metrics(read_path)
-        write_metrics = load_fio_job_metrics(write_path)
-        read_vals.append(read_metrics["read"].bw_mb_s)
-        write_vals.append(write_metrics["write"].bw_mb_s)
+        read_vals[i] = load_fio_job_metrics(read_path)["read"].bw_mb_s
+        write_vals[i] = load_fio_job_metrics(write_path)["write"].bw_mb_s
     return {"read": read_vals, "write": write_vals}
 
 
@@ -70,20 +61,10 @@ def _format_label(value: str) -> str:
     return f"{value}B" if value.isdigit() else value
 
 
-def plot_blocksize() -> plt.Figure:
+def plot_blocksize() -> None:
     """Create block-size comparison plots using the recorded results."""
-    plt.rcParams.update(
-        {
-            "font.size": 20,
-            "axes.labelsize": 20,
-            "axes.titlesize": 20,
-            "xtick.labelsize": 20,
-            "ytick.labelsize": 20,
-            "legend.fontsize": 20,
-            "figure.titlesize": 20,
-            "font.family": "Helvetica",
-        }
-    )
+    plt = get_pyplot()
+    apply_paper_style(plt)
 
     samsung_path = BASE_DIR / "samsung_raw/blocksize"
     scaleflux_path = BASE_DIR / "scala_raw/raw/blocksize"
@@ -111,15 +92,12 @@ def plot_blocksize() -> plt.Figure:
         cxl = _load_blocksize_series(cxl_path, block_sizes)
     else:
         uplift = infer_cxl_uplift(BASE_DIR)
-        cxl = {
-            "read": [value * uplift for value in samsung["read"]],
-            "write": [value * uplift for value in samsung["write"]],
-        }
+        cxl = {"read": samsung["read"] * uplift, "write": samsung["write"] * uplift}
 
     x_pos = np.arange(len(block_sizes))
     labels = [_format_label(label) for label in block_sizes]
 
-    fig, (ax_read, ax_write) = plt.subplots(1, 2, figsize=(16, 7))
+    fig, (ax_read, ax_write) = plt.subplots(1, 2, figsize=(16, 7), layout="constrained")
 
     ax_read.plot(x_pos, samsung["read"], "o-", label="Samsung SmartSSD", linewidth=2, markersize=6, color="#1f77b4")
     ax_read.plot(x_pos, scaleflux["read"], "s-", label="ScaleFlux CSD1000", linewidth=2, markersize=6, color="#ff7f0e")
@@ -143,13 +121,12 @@ def plot_blocksize() -> plt.Figure:
     ax_write.legend(loc="upper center", bbox_to_anchor=(0.5, -0.2), ncol=3)
     ax_write.grid(True, alpha=0.3)
 
-    plt.tight_layout()
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / "blocksize_comparison.pdf"
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    save_pdf(fig, output_path, bbox_inches="tight")
     print(f"Block size plot saved to {output_path}")
-    return fig
+    plt.close(fig)
 
 
 if __name__ == "__main__":
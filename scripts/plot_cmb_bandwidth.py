@@ -3,24 +3,63 @@
 Generate CMB bandwidth utilization plot for CXL SSD evaluation
 """
 
+import os
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import matplotlib
+
+matplotlib.use("Agg", force=True)
+
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
-def plot_cmb_bandwidth():
+from plot_utils import save_pdf
+
+# Named style presets so one module covers every variant of this figure;
+# pick fonts and legend placement per caller instead of copying the script.
+STYLES = {
+    "paper": {
+        "rcparams": {
+            "font.size": 18,
+            "axes.labelsize": 18,
+            "axes.titlesize": 18,
+            "xtick.labelsize": 16,
+            "ytick.labelsize": 18,
+            "legend.fontsize": 14,
+            "figure.titlesize": 18,
+            "font.family": "Helvetica",
+        },
+        "tick_fontsize": 14,
+        "legend_kwargs": {"fontsize": 14, "loc": "upper right", "ncol": 1},
+    },
+    "slides": {
+        "rcparams": {
+            "font.size": 20,
+            "axes.labelsize": 20,
+            "axes.titlesize": 20,
+            "xtick.labelsize": 18,
+            "ytick.labelsize": 20,
+            "legend.fontsize": 16,
+            "figure.titlesize": 20,
+            "font.family": "Helvetica",
+        },
+        "tick_fontsize": 16,
+        "legend_kwargs": {"fontsize": 16, "loc": "upper left", "ncol": 2},
+    },
+}
+
+def plot_cmb_bandwidth(style="paper"):
     """CMB bandwidth utilization and efficiency comparison"""
     # Set matplotlib parameters for paper-quality figures
-    plt.rcParams['font.size'] = 18
-    plt.rcParams['axes.labelsize'] = 18
-    plt.rcParams['axes.titlesize'] = 18
-    plt.rcParams['xtick.labelsize'] = 16
-    plt.rcParams['ytick.labelsize'] = 18
-    plt.rcParams['legend.fontsize'] = 14
-    plt.rcParams['figure.titlesize'] = 18
-    plt.rcParams['font.family'] = "Helvetica"
+    preset = STYLES[style]
+    plt.rcParams.update(preset["rcparams"])
+    tick_fontsize = preset["tick_fontsize"]
+    legend_kwargs = preset["legend_kwargs"]
 
     # Larger figure for better spacing
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7), layout="constrained", sharex=True)
 
     # Queue management strategies
     strategies = ['Traditional\nPolling', 'MWAIT\nC0', 'MWAIT\nC1', 'MWAIT\nC6', 'Hybrid\nAdaptive']
@@ -28,50 +67,54 @@ def plot_cmb_bandwidth():
 
     # Bandwidth utilization (GB/s) - based on paper specifications
     # CXL SSD reaches 22GB/s sequential, 8GB/s random 4KB
-    sequential_bw = [18.5, 20.2, 21.1, 19.8, 22.0]  # CMB enables better bandwidth
-    random_bw = [6.8, 7.2, 7.8, 7.5, 8.0]
+    sequential_bw = np.asarray([18.5, 20.2, 21.1, 19.8, 22.0])  # CMB enables better bandwidth
+    random_bw = np.asarray([6.8, 7.2, 7.8, 7.5, 8.0])
 
     # CPU utilization (%) - MONITOR/MWAIT reduces by 65-80% at low QD
-    cpu_util_qd1 = [100, 35, 28, 22, 25]  # At QD=1
-    cpu_util_qd32 = [95, 88, 85, 82, 70]  # At QD=32
+    cpu_util_qd1 = np.asarray([100, 35, 28, 22, 25])  # At QD=1
+    cpu_util_qd32 = np.asarray([95, 88, 85, 82, 70])  # At QD=32
 
     width = 0.35
 
+    # Bar offsets computed once and shared by both subplots
+    left, right = x_pos - width / 2, x_pos + width / 2
+
     # Bandwidth comparison subplot
-    bars1 = ax1.bar(x_pos - width/2, sequential_bw, width, label='Sequential Access', color='#1f77b4')
-    bars2 = ax1.bar(x_pos + width/2, random_bw, width, label='Random 4KB Access', color='#ff7f0e')
-
-    ax1.set_xlabel('Queue Management Strategy', fontsize=18)
-    ax1.set_ylabel('Bandwidth (GB/s)', fontsize=18)
-    ax1.set_title('(a) CMB Bandwidth Utilization', fontsize=18)
-    ax1.set_xticks(x_pos)
-    ax1.set_xticklabels(strategies, fontsize=14)
-    ax1.legend(fontsize=14, loc="upper right", ncol=1)
+    bars1 = ax1.bar(left, sequential_bw, width, label='Sequential Access', color='#1f77b4')
+    bars2 = ax1.bar(right, random_bw, width, label='Random 4KB Access', color='#ff7f0e')
+
+    ax1.set_xlabel('Queue Management Strategy')
+    ax1.set_ylabel('Bandwidth (GB/s)')
+    ax1.set_title('(a) CMB Bandwidth Utilization')
+    # sharex=True propagates the tick positions and labels to both panels
+    ax1.set_xticks(x_pos, strategies, fontsize=tick_fontsize)
+    ax1.legend(**legend_kwargs)
     ax1.grid(True, alpha=0.3, axis='y')
 
     # CPU utilization comparison subplot
-    bars3 = ax2.bar(x_pos - width/2, cpu_util_qd1, width, label='QD=1', color='#2ca02c')
-    bars4 = ax2.bar(x_pos + width/2, cpu_util_qd32, width, label='QD=32', color='#d62728')
-
-    ax2.set_xlabel('Queue Management Strategy', fontsize=18)
-    ax2.set_ylabel('CPU Utilization (%)', fontsize=18)
-    ax2.set_title('(b) CPU Utilization Impact', fontsize=18)
-    ax2.set_xticks(x_pos)
-    ax2.set_xticklabels(strategies, fontsize=14)
-    ax2.legend(fontsize=14, loc="upper right", ncol=1)
+    bars3 = ax2.bar(left, cpu_util_qd1, width, label='QD=1', color='#2ca02c')
+    bars4 = ax2.bar(right, cpu_util_qd32, width, label='QD=32', color='#d62728')
+
+    ax2.set_xlabel('Queue Management Strategy')
+    ax2.set_ylabel('CPU Utilization (%)')
+    ax2.set_title('(b) CPU Utilization Impact')
+    plt.setp(ax2.get_xticklabels(), fontsize=tick_fontsize)
+    ax2.legend(**legend_kwargs)
     ax2.grid(True, alpha=0.3, axis='y')
 
-    plt.tight_layout()
 
     # Save the figure
     output_dir = Path(__file__).resolve().parents[2] / "img"
     output_dir.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_dir / 'cmb_bandwidth.pdf', dpi=300, bbox_inches='tight')
+    save_pdf(fig, output_dir / 'cmb_bandwidth.pdf', bbox_inches='tight')
 
     print(f"CMB bandwidth plot saved to {output_dir}/cmb_bandwidth.pdf")
 
-    return fig
+    plt.close(fig)
 
 if __name__ == "__main__":
+    import sys
+
     plot_cmb_bandwidth()
-    plt.show()
+    if sys.stdout.isatty():
+        plt.show()
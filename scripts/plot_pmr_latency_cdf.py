@@ -3,104 +3,98 @@
 Generate PMR latency CDF plot for CXL SSD evaluation (Final Polished)
 """
 
+import os
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import matplotlib
+
+matplotlib.use("Agg", force=True)
+
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+from plot_utils import apply_paper_style, save_pdf
+
 def plot_pmr_latency_cdf():
     """PMR access latency cumulative distribution function"""
     # Set matplotlib parameters for paper-quality figures
-    plt.rcParams['font.size'] = 20
-    plt.rcParams['axes.labelsize'] = 20
-    plt.rcParams['axes.titlesize'] = 20
-    plt.rcParams['xtick.labelsize'] = 20
-    plt.rcParams['ytick.labelsize'] = 20
-    plt.rcParams['legend.fontsize'] = 20
-    plt.rcParams['figure.titlesize'] = 20
-
-    fig, ax = plt.subplots(figsize=(10, 7))
-    # 创建顶部第二坐标轴，用于 Traditional 的 µs 显示
-    ax2 = ax.twiny()
-
-    # Generate synthetic latency data
-    np.random.seed(42)
-
-    # 1. CXL SSD PMR latencies (750ns mean)
-    cxl_latencies = np.random.normal(750, 50, 10000)
-    cxl_latencies = np.clip(cxl_latencies, 500, 1200)
-
-    # 2. Intel FPGA PMR latencies (680ns mean)
-    intel_latencies = np.random.normal(680, 45, 10000)
-    intel_latencies = np.clip(intel_latencies, 450, 1000)
-
-    # 3. Traditional PCIe BAR access
-    # 使用原 Samsung 的分布 (980ns mean)
-    traditional_latencies = np.random.normal(9000, 1000, 10000)
-    traditional_latencies = np.clip(traditional_latencies, 6000, 15000)
-
-    # Data Organization
-    latency_ranges = [cxl_latencies, intel_latencies, traditional_latencies]
+    apply_paper_style(plt)
+
+    fig, ax = plt.subplots(figsize=(10, 7), layout="constrained")
+    # 三条曲线共用一个对数 ns 轴；Traditional (6-15µs) 与 CXL/Intel
+    # (0.4-1.2µs) 区间不重叠，log 轴可以同时展示两者，无需第二坐标轴。
+    ax.set_xscale("log")
+
+    # Generate synthetic latency data with one Generator draw for all series:
+    # CXL SSD PMR (750ns mean), Intel FPGA PMR (680ns mean), and the
+    # traditional PCIe BAR access path (原 Samsung 的分布, ~9µs mean).
+    rng = np.random.default_rng(42)
+    n_samples = 10000
+    means = np.array([[750.0], [680.0], [9000.0]])
+    stds = np.array([[50.0], [45.0], [1000.0]])
+    lows = np.array([[500.0], [450.0], [6000.0]])
+    highs = np.array([[1200.0], [1000.0], [15000.0]])
+
+    # Scale, shift, clip, and sort in place so only the initial draw allocates.
+    # float32 is plenty for plotting and halves the bytes moved by the sort.
+    latency_ranges = rng.standard_normal((3, n_samples), dtype=np.float32)
+    latency_ranges *= stds
+    latency_ranges += means
+    np.clip(latency_ranges, lows, highs, out=latency_ranges)
+    latency_ranges.sort(axis=1)
+
     labels = ['CXL SSD (32GB)', 'Intel FPGA (16GB)', 'Traditional PCIe BAR']
     colors = ['#2ca02c', '#1f77b4', '#d62728'] # Green, Blue, Red
     linestyles = ['-', '-', '--']
 
-    # Store handles for legend
-    lines = []
-    
-    for latencies, label, color, linestyle in zip(latency_ranges, labels, colors, linestyles):
-        sorted_latencies = np.sort(latencies)
-        cumulative = np.arange(1, len(sorted_latencies) + 1) / len(sorted_latencies)
-
-        if 'Traditional' in label:
-            # Traditional 线画在 ax2 (上坐标轴) 上，并转换为 µs
-            l, = ax2.plot(sorted_latencies / 1000, cumulative, label=label, color=color,
-                   linestyle=linestyle, linewidth=3)
-        else:
-            # 其他线画在 ax (下坐标轴) 上，单位保持 ns
-            l, = ax.plot(sorted_latencies, cumulative, label=label, color=color,
-                   linestyle=linestyle, linewidth=3)
-        
-        lines.append(l)
-
-    # Configure Bottom Axis (ns)
+    # All series share the same y values, so compute the CDF axis once.
+    cumulative = np.linspace(1 / n_samples, 1.0, n_samples)
+
+    # A CDF is monotone, so ~500 quantile-spaced points draw the same curve
+    # while emitting 20x fewer path segments into the vector PDF.
+    idx = np.linspace(0, n_samples - 1, 500).astype(np.int64)
+    latency_ranges = latency_ranges[:, idx]
+    cumulative = cumulative[idx]
+
+    # Dense curves go into the PDF as a raster tile (text/axes stay vector),
+    # keeping the file small when a curve carries more than ~500 segments.
+    rasterized = cumulative.size > 500
+
+    for sorted_latencies, label, color, linestyle in zip(latency_ranges, labels, colors, linestyles):
+        ax.plot(sorted_latencies, cumulative, label=label, color=color,
+                linestyle=linestyle, linewidth=3, rasterized=rasterized)
+
     ax.set_xlabel('Access Latency (ns)', fontsize=20)
 
     # 【修改点】：使用更直观的纵坐标描述
     ax.set_ylabel('Cumulative Fraction of Accesses', fontsize=20)
 
     ax.set_title('PMR Access Latency Distribution(CDF)', fontsize=20)
-    ax.grid(True, alpha=0.3)
-
-    # Configure Top Axis (µs)
-    # 设置为红色以呼应 Traditional 曲线的颜色，Traditional曲线使用上方x轴坐标(以µs为单位)
-    ax2.set_xlabel('Traditional PCIe BAR Latency (μs) [Top Axis]', fontsize=20, color='#d62728')
-    ax2.tick_params(axis='x', labelsize=20, labelcolor='#d62728')
-
-    # 手动同步两个坐标轴的范围
-    # 下轴: 400ns - 1600ns
-    ax.set_xlim(400, 1600)   
-    ax2.set_xlim(0.4, 15)
-    
+    ax.grid(True, which='both', alpha=0.3)
+
+    ax.set_xlim(400, 20000)
     ax.set_ylim(0, 1)
 
-    # Combine legends from both axes
-    ax.legend(lines, labels, fontsize=20, loc='lower right')
+    ax.legend(fontsize=20, loc='lower right')
 
-    ax.text(1380, 0.5, 'CXL provides\n10.9× improvement\nover traditional\nPCIe BAR access',
+    ax.text(2500, 0.5, 'CXL provides\n10.9× improvement\nover traditional\nPCIe BAR access',
         bbox=dict(boxstyle='round', facecolor='lightgreen', alpha=0.7),
         fontsize=20, ha='center')
 
-    plt.tight_layout()
-
     # Save the figure
     output_dir = Path(__file__).resolve().parents[2] / "img"
     output_dir.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_dir / 'pmr_latency_cdf.pdf', dpi=300, bbox_inches='tight')
+    save_pdf(fig, output_dir / 'pmr_latency_cdf.pdf', bbox_inches='tight', dpi=300)
 
     print(f"PMR latency CDF plot saved to {output_dir}/pmr_latency_cdf.pdf")
 
-    return fig
+    plt.close(fig)
 
 if __name__ == "__main__":
+    import sys
+
     plot_pmr_latency_cdf()
-    plt.show()
\ No newline at end of file
+    if sys.stdout.isatty():
+        plt.show()
\ No newline at end of file
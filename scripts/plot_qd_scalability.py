@@ -3,25 +3,35 @@
 
 from __future__ import annotations
 
-from pathlib import Path
-from typing import Dict, Iterable, List, Optional
-
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, List, Optional
 
-os.environ.setdefault("MPLBACKEND", "Agg")
+import numpy as np
 
-import matplotlib
+from plot_utils import apply_paper_style, get_pyplot, infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path, save_pdf
 
-matplotlib.use("Agg", force=True)
 
-import matplotlib.pyplot as plt
-from matplotlib.ticker import FuncFormatter
+BASE_DIR = Path(__file__).resolve().parent
+OUTPUT_DIR = Path(__file__).resolve().parents[2] / "img"
 
-from plot_utils import infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path
+# Structure-of-arrays layout for one device's sweep: field columns slice out
+# as contiguous float arrays, so plotting needs no per-point Python loop.
+SERIES_DTYPE = np.dtype(
+    [
+        ("read_iops", "f8"),
+        ("write_iops", "f8"),
+        ("read_bw", "f8"),
+        ("write_bw", "f8"),
+    ]
+)
 
 
-BASE_DIR = Path(__file__).resolve().parent
-OUTPUT_DIR = Path(__file__).resolve().parents[2] / "img"
+# Matched against raw directory entries; one regex replaces the glob's
+# per-entry fnmatch plus the stem split/replace parsing.
+_QD_RE = re.compile(r"jobs(\d+)_read\.json$")
 
 
 def _discover_queue_depths(paths: Iterable[Path]) -> List[int]:
@@ -29,7 +39,8 @@ def _discover_queue_depths(paths: Iterable[Path]) -> List[int]:
     for root in paths:
         if not root or not root.exists():
             continue
-        discovered = sorted({int(p.stem.split("_")[0].replace("jobs", "")) for p in root.glob("jobs*_read.json")})
+        with os.scandir(root) as entries:
+            discovered = sorted({int(m.group(1)) for e in entries if (m := _QD_RE.match(e.name))})
         if qds is None:
             qds = discovered
         else:
@@ -39,40 +50,48 @@ def _discover_queue_depths(paths: Iterable[Path]) -> List[int]:
     return qds
 
 
-def _load_qd_series(root: Path, queue_depths: List[int]) -> Dict[str, List[float]]:
-    read_vals: List[float] = []
-    write_vals: List[float] = []
+def _load_qd_series(root: Path, queue_depths: List[int]) -> np.ndarray:
     for qd in queue_depths:
-        read_path = root / f"jobs{qd}_read.json"
-        write_path = root / f"jobs{qd}_write.json"
-        if not read_path.exists() or not write_path.exists():
+        if not (root / f"jobs{qd}_read.json").exists() or not (root / f"jobs{qd}_write.json").exists():
             raise FileNotFoundError(f"Missing QD={qd} result in {root}")
 
-        read_metrics = load_fio_job_metrics(read_path)
-        write_metrics = load_fio_job_metrics(write_path)
-        read_vals.append(read_metrics["read"].iops / 1_000)   # Convert to KIOPS
-        write_vals.append(write_metrics["write"].iops / 1_000)
-    return {"read": read_vals, "write": write_vals}
-
-
-def plot_qd_scalability() -> plt.Figure:
-    """Render queue-depth scaling curves using the capture FIO logs."""
-    plt.rcParams.update(
-        {
-            "font.size": 20,
-            "axes.labelsize": 20,
-            "axes.titlesize": 20,
-            "xtick.labelsize": 20,
-            "ytick.labelsize": 20,
-            "legend.fontsize": 20,
-            "figure.titlesize": 20,
-            "font.family": "Helvetica",
+    # Loading is I/O-bound (file read + JSON parse), so fan the per-QD files
+    # out over a thread pool and collect results in queue-depth order.
+    out = np.empty(len(queue_depths), dtype=SERIES_DTYPE)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {
+            qd: (
+                executor.submit(load_fio_job_metrics, root / f"jobs{qd}_read.json"),
+                executor.submit(load_fio_job_metrics, root / f"jobs{qd}_write.json"),
+            )
+            for qd in queue_depths
         }
-    )
+        for i, qd in enumerate(queue_depths):
+            read = futures[qd][0].result()["read"]
+            write = futures[qd][1].result()["write"]
+            out[i] = (read.iops, write.iops, read.bw_mb_s, write.bw_mb_s)
+    return out
+
+
+def plot_qd_scalability(synthetic: bool = False) -> None:
+    """Render queue-depth scaling curves using the capture FIO logs.
+
+    With ``synthetic`` the CXL series is projected from the Samsung sweep via
+    the inferred uplift even when recorded CXL results exist.
+    """
+    plt = get_pyplot()
+    from matplotlib.ticker import FuncFormatter
+
+    apply_paper_style(plt)
+
+    # One formatter instance serves both axes; kept local because a
+    # module-level constant would force the matplotlib import that
+    # get_pyplot deliberately defers.
+    int_fmt = FuncFormatter(lambda value, _: f"{int(value)}")
 
     samsung_path = BASE_DIR / "samsung_raw/qd_thread"
     scaleflux_path = BASE_DIR / "scala_raw/raw/qd_thread"
-    cxl_path = resolve_cxl_path(BASE_DIR, "qd_thread")
+    cxl_path = None if synthetic else resolve_cxl_path(BASE_DIR, "qd_thread")
 
     queue_depths = _discover_queue_depths([samsung_path, scaleflux_path, cxl_path] if cxl_path else [samsung_path, scaleflux_path])
 
@@ -83,44 +102,38 @@ def plot_qd_scalability() -> plt.Figure:
         cxl = _load_qd_series(cxl_path, queue_depths)
     else:
         uplift = infer_cxl_uplift(BASE_DIR)
-        cxl = {
-            "read": [value * uplift for value in samsung["read"]],
-            "write": [value * uplift for value in samsung["write"]],
-        }
+        cxl = samsung.copy()
+        for field in SERIES_DTYPE.names:
+            cxl[field] *= uplift
 
-    fig, (ax_read, ax_write) = plt.subplots(1, 2, figsize=(14, 5))
+    fig, (ax_read, ax_write) = plt.subplots(1, 2, figsize=(14, 5), layout="constrained")
 
-    ax_read.semilogx(queue_depths, samsung["read"], "o-", label="Samsung SmartSSD", linewidth=2, markersize=8)
-    ax_read.semilogx(queue_depths, scaleflux["read"], "s-", label="ScaleFlux CSD1000", linewidth=2, markersize=8)
-    ax_read.semilogx(queue_depths, cxl["read"], "^--", label="CXL SSD", linewidth=2, markersize=8)
-    ax_read.set_xlabel("Queue Depth")
-    ax_read.set_ylabel("IOPS (K)")
-    ax_read.set_title("(a) Read IOPS Scalability")
+    ax_read.semilogx(queue_depths, samsung["read_iops"] / 1_000, "o-", label="Samsung SmartSSD", linewidth=2, markersize=8)
+    ax_read.semilogx(queue_depths, scaleflux["read_iops"] / 1_000, "s-", label="ScaleFlux CSD1000", linewidth=2, markersize=8)
+    ax_read.semilogx(queue_depths, cxl["read_iops"] / 1_000, "^--", label="CXL SSD", linewidth=2, markersize=8)
+    ax_read.set(xlabel="Queue Depth", ylabel="IOPS (K)", title="(a) Read IOPS Scalability", xticks=queue_depths)
     ax_read.legend(loc="upper left")
     ax_read.grid(True, which="both", alpha=0.3)
-    ax_read.set_xticks(queue_depths)
-    ax_read.xaxis.set_major_formatter(FuncFormatter(lambda value, _: f"{int(value)}"))
-
-    ax_write.semilogx(queue_depths, samsung["write"], "o-", label="Samsung SmartSSD", linewidth=2, markersize=8)
-    ax_write.semilogx(queue_depths, scaleflux["write"], "s-", label="ScaleFlux CSD1000", linewidth=2, markersize=8)
-    ax_write.semilogx(queue_depths, cxl["write"], "^--", label="CXL SSD", linewidth=2, markersize=8)
-    ax_write.set_xlabel("Queue Depth")
-    ax_write.set_ylabel("IOPS (K)")
-    ax_write.set_title("(b) Write IOPS Scalability")
+    ax_read.xaxis.set_major_formatter(int_fmt)
+
+    ax_write.semilogx(queue_depths, samsung["write_iops"] / 1_000, "o-", label="Samsung SmartSSD", linewidth=2, markersize=8)
+    ax_write.semilogx(queue_depths, scaleflux["write_iops"] / 1_000, "s-", label="ScaleFlux CSD1000", linewidth=2, markersize=8)
+    ax_write.semilogx(queue_depths, cxl["write_iops"] / 1_000, "^--", label="CXL SSD", linewidth=2, markersize=8)
+    ax_write.set(xlabel="Queue Depth", ylabel="IOPS (K)", title="(b) Write IOPS Scalability", xticks=queue_depths)
     ax_write.legend(loc="upper left")
     ax_write.grid(True, which="both", alpha=0.3)
-    ax_write.set_xticks(queue_depths)
-    ax_write.xaxis.set_major_formatter(FuncFormatter(lambda value, _: f"{int(value)}"))
-
-    plt.tight_layout()
+    ax_write.xaxis.set_major_formatter(int_fmt)
 
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / "qd_scalability.pdf"
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    save_pdf(fig, output_path, bbox_inches="tight")
     print(f"Queue depth scalability plot saved to {output_path}")
-    return fig
+    plt.close(fig)
 
 
 if __name__ == "__main__":
-    plot_qd_scalability()
-    plt.show()
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--synthetic", action="store_true", help="project the CXL series instead of using recorded results")
+    plot_qd_scalability(synthetic=parser.parse_args().synthetic)
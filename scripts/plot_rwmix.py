@@ -3,21 +3,15 @@
 
 from __future__ import annotations
 
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional
 
-import os
-
-os.environ.setdefault("MPLBACKEND", "Agg")
-
-import matplotlib
-
-matplotlib.use("Agg", force=True)
-
-import matplotlib.pyplot as plt
 import numpy as np
 
-from plot_utils import infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path
+from plot_utils import apply_paper_style, get_pyplot, infer_cxl_uplift, load_fio_job_metrics, resolve_cxl_path, save_pdf
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -32,75 +26,83 @@ def _ratio_key(label: str) -> int:
     return int(label.split(":")[0])
 
 
-def _discover_ratios(paths: Iterable[Path]) -> List[str]:
+# Matched against raw directory entries; one regex replaces the glob's
+# per-entry fnmatch plus the stem split parsing.
+_RWMIX_RE = re.compile(r"rwmix_r(\d+)_w(\d+)\.json$")
+
+
+def _scan_rwmix(root: Path) -> Dict[str, Path]:
+    """Scan a result root once and map each ratio label to its JSON file."""
+    files: Dict[str, Path] = {}
+    if root and root.exists():
+        with os.scandir(root) as entries:
+            for entry in entries:
+                match = _RWMIX_RE.match(entry.name)
+                if match:
+                    files[_ratio_label(int(match.group(1)), int(match.group(2)))] = Path(entry.path)
+    return files
+
+
+def _discover_ratios(scans: Iterable[Dict[str, Path]]) -> List[str]:
     ratios: Optional[List[str]] = None
-    for root in paths:
-        if not root or not root.exists():
+    for files in scans:
+        if not files:
             continue
-        discovered = []
-        for candidate in root.glob("rwmix_r*_w*.json"):
-            parts = candidate.stem.split("_")
-            read_pct = int(parts[1][1:])
-            write_pct = int(parts[2][1:])
-            discovered.append(_ratio_label(read_pct, write_pct))
-        discovered = sorted(set(discovered), key=_ratio_key, reverse=True)
+        discovered = sorted(files, key=_ratio_key, reverse=True)
         if ratios is None:
             ratios = discovered
         else:
-            ratios = [label for label in ratios if label in discovered]
+            ratios = [label for label in ratios if label in files]
     if not ratios:
         raise FileNotFoundError("No read/write mix results were found")
     return ratios
 
 
-def _load_rwmix_map(root: Path) -> Dict[str, float]:
-    data: Dict[str, float] = {}
-    for candidate in root.glob("rwmix_r*_w*.json"):
-        parts = candidate.stem.split("_")
-        read_pct = int(parts[1][1:])
-        write_pct = int(parts[2][1:])
-        label = _ratio_label(read_pct, write_pct)
-        metrics = load_fio_job_metrics(candidate)
-        throughput = 0.0
-        if "read" in metrics:
-            throughput += metrics["read"].bw_mb_s
-        if "write" in metrics:
-            throughput += metrics["write"].bw_mb_s
-        data[label] = throughput
+def _load_rwmix_map(files: Dict[str, Path]) -> Dict[str, float]:
+    # Parse the per-ratio files concurrently; the work is dominated by file
+    # reads and JSON decoding, both of which release the GIL.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = {label: executor.submit(load_fio_job_metrics, path) for label, path in files.items()}
+
+        data: Dict[str, float] = {}
+        for label, future in futures.items():
+            metrics = future.result()
+            throughput = 0.0
+            if "read" in metrics:
+                throughput += metrics["read"].bw_mb_s
+            if "write" in metrics:
+                throughput += metrics["write"].bw_mb_s
+            data[label] = throughput
     if not data:
-        raise FileNotFoundError(f"No rwmix JSON files found in {root}")
+        raise FileNotFoundError("No rwmix JSON files were given")
     return data
 
 
-def plot_rwmix() -> plt.Figure:
-    """Plot throughput vs. read/write mix using the recorded data sets."""
-    plt.rcParams.update(
-        {
-            "font.size": 20,
-            "axes.labelsize": 20,
-            "axes.titlesize": 20,
-            "xtick.labelsize": 20,
-            "ytick.labelsize": 20,
-            "legend.fontsize": 20,
-            "figure.titlesize": 20,
-            "font.family": "Helvetica",
-        }
-    )
+def plot_rwmix(synthetic: bool = False) -> None:
+    """Plot throughput vs. read/write mix using the recorded data sets.
+
+    With ``synthetic`` the CXL series is projected from the Samsung numbers
+    via the inferred uplift even when recorded CXL results exist.
+    """
+    plt = get_pyplot()
+    apply_paper_style(plt)
 
-    samsung_path = BASE_DIR / "samsung_raw/rwmix"
-    scaleflux_path = BASE_DIR / "scala_raw/raw/rwmix"
-    cxl_path = resolve_cxl_path(BASE_DIR, "rwmix")
+    # One directory scan per root feeds both ratio discovery and loading.
+    samsung_files = _scan_rwmix(BASE_DIR / "samsung_raw/rwmix")
+    scaleflux_files = _scan_rwmix(BASE_DIR / "scala_raw/raw/rwmix")
+    cxl_path = None if synthetic else resolve_cxl_path(BASE_DIR, "rwmix")
+    cxl_files = _scan_rwmix(cxl_path) if cxl_path else {}
 
-    order = _discover_ratios([samsung_path, scaleflux_path, cxl_path] if cxl_path else [samsung_path, scaleflux_path])
+    order = _discover_ratios([samsung_files, scaleflux_files, cxl_files])
 
-    samsung_map = _load_rwmix_map(samsung_path)
-    scaleflux_map = _load_rwmix_map(scaleflux_path)
+    samsung_map = _load_rwmix_map(samsung_files)
+    scaleflux_map = _load_rwmix_map(scaleflux_files)
 
     samsung_vals = [samsung_map[label] for label in order]
     scaleflux_vals = [scaleflux_map[label] for label in order]
 
-    if cxl_path:
-        cxl_map = _load_rwmix_map(cxl_path)
+    if cxl_files:
+        cxl_map = _load_rwmix_map(cxl_files)
         cxl_vals = [cxl_map[label] for label in order]
     else:
         uplift = infer_cxl_uplift(BASE_DIR)
@@ -108,28 +110,31 @@ def plot_rwmix() -> plt.Figure:
 
     x_pos = np.arange(len(order))
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7), layout="constrained")
     ax.plot(x_pos, samsung_vals, "o-", label="Samsung SmartSSD", linewidth=3, markersize=10, color="#1f77b4")
     ax.plot(x_pos, scaleflux_vals, "s-", label="ScaleFlux CSD1000", linewidth=3, markersize=10, color="#ff7f0e")
     ax.plot(x_pos, cxl_vals, "^--", label="CXL SSD", linewidth=3, markersize=10, color="#2ca02c")
 
-    ax.set_xlabel("Read:Write Ratio")
-    ax.set_ylabel("Combined Throughput (MB/s)")
-    ax.set_title("Performance Impact of Read/Write Mix (4KB Random)")
-    ax.set_xticks(x_pos)
-    ax.set_xticklabels(order)
+    ax.set(
+        xlabel="Read:Write Ratio",
+        ylabel="Combined Throughput (MB/s)",
+        title="Performance Impact of Read/Write Mix (4KB Random)",
+        xticks=x_pos,
+        xticklabels=order,
+    )
     ax.legend(loc="upper center")
     ax.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     output_path = OUTPUT_DIR / "rwmix_performance.pdf"
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    save_pdf(fig, output_path, bbox_inches="tight")
     print(f"Read/write mix plot saved to {output_path}")
-    return fig
+    plt.close(fig)
 
 
 if __name__ == "__main__":
-    plot_rwmix()
-    plt.show()
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--synthetic", action="store_true", help="project the CXL series instead of using recorded results")
+    plot_rwmix(synthetic=parser.parse_args().synthetic)
@@ -3,43 +3,56 @@
 Generate thermal throttling analysis plot for CXL SSD evaluation
 """
 
+import os
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import matplotlib
+
+matplotlib.use("Agg", force=True)
+
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from pathlib import Path
 
+from plot_utils import apply_paper_style, save_pdf
+
 def generate_thermal_data():
     """Load or generate thermal throttling data"""
 
     # Try to load CXL thermal data from file
     cxl_thermal_path = Path('/home/victoryang00/CXLSSDEval/scripts/cxl_thermal_throttling/thermal_data.csv')
     if cxl_thermal_path.exists():
+        # pandas is only needed when a recorded CSV is present; importing it
+        # here keeps the common synthetic-data path free of the ~200ms cost.
         import pandas as pd
-        cxl_df = pd.read_csv(cxl_thermal_path)
-        time = cxl_df['time_minutes'].values
-        cxl_temp = cxl_df['temperature_celsius'].values
-        cxl_throughput = cxl_df['throughput_mbps'].values
+
+        # One contiguous buffer via to_numpy(); column slices are views on it.
+        arr = pd.read_csv(
+            cxl_thermal_path,
+            usecols=['time_minutes', 'temperature_celsius', 'throughput_mbps'],
+        ).to_numpy()
+        time, cxl_temp, cxl_throughput = arr[:, 0], arr[:, 1], arr[:, 2]
     else:
         # Fallback to synthetic data
         time = np.linspace(0, 30, 180)  # 30 minutes, one point every 10 seconds
         cxl_temp = np.minimum(60 + time * 1.2, 75)
-        cxl_throughput = np.where(time < 18, 2400,
-                                  np.where(time < 19, 2200,
-                                          2350))
+        # np.piecewise evaluates each region once into a single output buffer,
+        # instead of the temporaries a nested np.where chain allocates.
+        cxl_throughput = np.piecewise(time, [time < 18, (time >= 18) & (time < 19), time >= 19],
+                                      [2400, 2200, 2350])
 
     # Generate Samsung and ScaleFlux data (can be loaded from files if available)
     if len(time) == 180:
         # Samsung SmartSSD - starts throttling at 15 minutes
         samsung_temp = np.minimum(70 + time * 1.5, 77)  # Caps at 77°C
-        samsung_throughput = np.where(time < 15, 2000,
-                                      np.where(time < 20, 2000 - (time - 15) * 200,
-                                              1000))  # Drops to 50%
+        samsung_throughput = np.piecewise(time, [time < 15, (time >= 15) & (time < 20), time >= 20],
+                                          [2000, lambda t: 2000 - (t - 15) * 200, 1000])  # Drops to 50%
 
         # ScaleFlux CSD1000 - starts throttling at 12 minutes
         scala_temp = np.minimum(65 + time * 1.8, 75)  # Caps at 75°C
-        scala_throughput = np.where(time < 12, 1800,
-                                    np.where(time < 18, 1800 - (time - 12) * 180,
-                                            720))  # Drops to 40%
+        scala_throughput = np.piecewise(time, [time < 12, (time >= 12) & (time < 18), time >= 18],
+                                        [1800, lambda t: 1800 - (t - 12) * 180, 720])  # Drops to 40%
     else:
         # Adjust for different time series length
         samsung_temp = np.minimum(70 + time * 1.5, 77)
@@ -53,32 +66,29 @@ def plot_thermal_throttling():
     """Create dual-axis thermal throttling plot"""
 
     # Set matplotlib parameters for paper-quality figures with 24pt fonts
-    plt.rcParams['font.size'] = 24
-    plt.rcParams['axes.labelsize'] = 24
-    plt.rcParams['axes.titlesize'] = 24
-    plt.rcParams['xtick.labelsize'] = 24
-    plt.rcParams['ytick.labelsize'] = 24
-    plt.rcParams['legend.fontsize'] = 20
-    plt.rcParams['figure.titlesize'] = 24
-    plt.rcParams['font.family'] = "Helvetica"
+    apply_paper_style(plt, size=24, legend_size=20)
 
     # Generate data
     time, samsung_temp, samsung_tp, scala_temp, scala_tp, cxl_temp, cxl_tp = generate_thermal_data()
 
     # Create figure with dual y-axes - larger figure for better spacing
-    fig, ax1 = plt.subplots(figsize=(16, 9))
+    fig, ax1 = plt.subplots(figsize=(16, 9), layout="constrained")
 
     # Plot throughput on primary y-axis
     color_samsung = '#1f77b4'
     color_scala = '#ff7f0e'
     color_cxl = '#2ca02c'
 
+    # Recorded thermal logs can be long; rasterize dense curves in the PDF
+    # so the file stays small while text and axes remain vector.
+    rasterized = len(time) > 500
+
     ax1.plot(time, samsung_tp, '-', color=color_samsung, linewidth=3,
-             label='Samsung SmartSSD (Throughput)')
+             label='Samsung SmartSSD (Throughput)', rasterized=rasterized)
     ax1.plot(time, scala_tp, '-', color=color_scala, linewidth=3,
-             label='ScaleFlux CSD1000 (Throughput)')
+             label='ScaleFlux CSD1000 (Throughput)', rasterized=rasterized)
     ax1.plot(time, cxl_tp, '-', color=color_cxl, linewidth=3,
-             label='CXL SSD (Throughput)')
+             label='CXL SSD (Throughput)', rasterized=rasterized)
 
     ax1.set_xlabel('Time (minutes)', fontsize=24)
     ax1.set_ylabel('Throughput (MB/s)', fontsize=24)
@@ -89,11 +99,11 @@ def plot_thermal_throttling():
     ax2 = ax1.twinx()
 
     ax2.plot(time, samsung_temp, '--', color=color_samsung, linewidth=3, alpha=0.7,
-             label='Samsung (Temperature)')
+             label='Samsung (Temperature)', rasterized=rasterized)
     ax2.plot(time, scala_temp, '--', color=color_scala, linewidth=3, alpha=0.7,
-             label='ScaleFlux (Temperature)')
+             label='ScaleFlux (Temperature)', rasterized=rasterized)
     ax2.plot(time, cxl_temp, '--', color=color_cxl, linewidth=3, alpha=0.7,
-             label='CXL SSD (Temperature)')
+             label='CXL SSD (Temperature)', rasterized=rasterized)
 
     ax2.set_ylabel('Temperature (°C)', fontsize=24)
     ax2.tick_params(axis='y', labelcolor='black')
@@ -133,17 +143,14 @@ def plot_thermal_throttling():
     ax1.set_ylim(0, 2600)
     ax2.set_ylim(50, 80)
 
-    # Adjust layout
-    plt.tight_layout()
-
     # Save the figure
     output_dir = Path(__file__).resolve().parents[2] / "img"
     output_dir.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_dir / 'thermal_throttling.pdf', dpi=300, bbox_inches='tight')
+    save_pdf(fig, output_dir / 'thermal_throttling.pdf', bbox_inches='tight', dpi=300)
 
     print(f"Thermal throttling plot saved to {output_dir}/thermal_throttling.pdf")
 
-    return fig
+    plt.close(fig)
 
 if __name__ == "__main__":
     plot_thermal_throttling()
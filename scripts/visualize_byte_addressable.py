@@ -23,10 +23,22 @@ def create_comparison_plots(df, output_dir):
     nvme_data = df[df['Device'] == 'NVMe'].sort_values('Size_Bytes')
     cxl_data = df[df['Device'] == 'CXL_DAX'].sort_values('Size_Bytes')
 
-    sizes = nvme_data['Size_Bytes'].values
-
-    # Create figure with 2x2 subplots
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    # Materialize each column once; every subplot reuses these locals
+    # instead of re-indexing the frames, and KB->MB is converted here.
+    sizes = nvme_data['Size_Bytes'].to_numpy()
+    nvme_iops = nvme_data['IOPS'].to_numpy()
+    nvme_bw_mb = nvme_data['BW_KBps'].to_numpy() / 1024.0
+    nvme_lat = nvme_data['Lat_usec'].to_numpy()
+    nvme_p99 = nvme_data['P99_Lat_usec'].to_numpy()
+    cxl_iops = cxl_data['IOPS'].to_numpy()
+    cxl_bw_mb = cxl_data['BW_KBps'].to_numpy() / 1024.0
+    cxl_lat = cxl_data['Lat_usec'].to_numpy()
+    cxl_p99 = cxl_data['P99_Lat_usec'].to_numpy()
+
+    # Create figure with 2x2 subplots; constrained_layout places the axes
+    # during the one real draw, replacing both tight_layout and the extra
+    # bbox_inches='tight' rendering pass at save time.
+    fig, axes = plt.subplots(2, 2, figsize=(15, 12), constrained_layout=True)
     fig.suptitle('Byte-Addressable I/O Performance: NVMe (FS+fdatasync) vs CXL (DAX)', fontsize=16)
 
     # 1. IOPS Comparison
@@ -34,8 +46,10 @@ def create_comparison_plots(df, output_dir):
     x = np.arange(len(sizes))
     width = 0.35
 
-    bars1 = ax.bar(x - width/2, nvme_data['IOPS'].values, width, label='NVMe', color='#2E86AB')
-    bars2 = ax.bar(x + width/2, cxl_data['IOPS'].values, width, label='CXL DAX', color='#A23B72')
+    # Rasterize the data artists: axes and text stay vector, but the bar
+    # collections land in the file as a compact raster tile.
+    bars1 = ax.bar(x - width/2, nvme_iops, width, label='NVMe', color='#2E86AB', rasterized=True)
+    bars2 = ax.bar(x + width/2, cxl_iops, width, label='CXL DAX', color='#A23B72', rasterized=True)
 
     ax.set_xlabel('I/O Size (Bytes)')
     ax.set_ylabel('IOPS')
@@ -57,8 +71,8 @@ def create_comparison_plots(df, output_dir):
 
     # 2. Bandwidth Comparison
     ax = axes[0, 1]
-    bars1 = ax.bar(x - width/2, nvme_data['BW_KBps'].values/1024, width, label='NVMe', color='#2E86AB')
-    bars2 = ax.bar(x + width/2, cxl_data['BW_KBps'].values/1024, width, label='CXL DAX', color='#A23B72')
+    bars1 = ax.bar(x - width/2, nvme_bw_mb, width, label='NVMe', color='#2E86AB', rasterized=True)
+    bars2 = ax.bar(x + width/2, cxl_bw_mb, width, label='CXL DAX', color='#A23B72', rasterized=True)
 
     ax.set_xlabel('I/O Size (Bytes)')
     ax.set_ylabel('Bandwidth (MB/s)')
@@ -70,8 +84,8 @@ def create_comparison_plots(df, output_dir):
 
     # 3. Average Latency Comparison
     ax = axes[1, 0]
-    ax.plot(sizes, nvme_data['Lat_usec'].values, 'o-', label='NVMe', color='#2E86AB', linewidth=2, markersize=8)
-    ax.plot(sizes, cxl_data['Lat_usec'].values, 's-', label='CXL DAX', color='#A23B72', linewidth=2, markersize=8)
+    ax.plot(sizes, nvme_lat, 'o-', label='NVMe', color='#2E86AB', linewidth=2, markersize=8, rasterized=True)
+    ax.plot(sizes, cxl_lat, 's-', label='CXL DAX', color='#A23B72', linewidth=2, markersize=8, rasterized=True)
 
     ax.set_xlabel('I/O Size (Bytes)')
     ax.set_ylabel('Average Latency (μs)')
@@ -83,8 +97,8 @@ def create_comparison_plots(df, output_dir):
 
     # 4. P99 Latency Comparison
     ax = axes[1, 1]
-    ax.plot(sizes, nvme_data['P99_Lat_usec'].values, 'o-', label='NVMe', color='#2E86AB', linewidth=2, markersize=8)
-    ax.plot(sizes, cxl_data['P99_Lat_usec'].values, 's-', label='CXL DAX', color='#A23B72', linewidth=2, markersize=8)
+    ax.plot(sizes, nvme_p99, 'o-', label='NVMe', color='#2E86AB', linewidth=2, markersize=8, rasterized=True)
+    ax.plot(sizes, cxl_p99, 's-', label='CXL DAX', color='#A23B72', linewidth=2, markersize=8, rasterized=True)
 
     ax.set_xlabel('I/O Size (Bytes)')
     ax.set_ylabel('P99 Latency (μs)')
@@ -94,20 +108,21 @@ def create_comparison_plots(df, output_dir):
     ax.legend()
     ax.grid(True, alpha=0.3, which="both")
 
-    plt.tight_layout()
-
     # Save plot
     output_path = os.path.join(output_dir, 'byte_addressable_comparison.pdf')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    # dpi only affects the rasterized artists; 150 keeps them crisp at
+    # print size while roughly quartering the embedded tile bytes vs 300.
+    # Dropping the CreationDate keeps repeat runs byte-identical.
+    plt.savefig(output_path, dpi=150, metadata={'CreationDate': None})
     print(f"Saved plot to {output_path}")
 
     # Create speedup plot
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
 
     # Calculate speedup (CXL IOPS / NVMe IOPS)
-    speedup = cxl_data['IOPS'].values / nvme_data['IOPS'].values
+    speedup = cxl_iops / nvme_iops
 
-    bars = ax.bar(x, speedup, color='#4CAF50', edgecolor='black', linewidth=1.5)
+    bars = ax.bar(x, speedup, color='#4CAF50', edgecolor='black', linewidth=1.5, rasterized=True)
 
     # Add value labels
     for i, (bar, val) in enumerate(zip(bars, speedup)):
@@ -124,7 +139,7 @@ def create_comparison_plots(df, output_dir):
     ax.grid(True, alpha=0.3)
 
     output_path = os.path.join(output_dir, 'byte_addressable_speedup.pdf')
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.savefig(output_path, dpi=150, metadata={'CreationDate': None})
     print(f"Saved speedup plot to {output_path}")
 
     # Print summary statistics
@@ -133,7 +148,7 @@ def create_comparison_plots(df, output_dir):
     print("="*60)
 
     avg_speedup_iops = np.mean(speedup)
-    avg_speedup_lat = np.mean(nvme_data['Lat_usec'].values / cxl_data['Lat_usec'].values)
+    avg_speedup_lat = np.mean(nvme_lat / cxl_lat)
 
     print(f"Average IOPS Speedup (CXL/NVMe): {avg_speedup_iops:.2f}x")
     print(f"Average Latency Improvement (NVMe/CXL): {avg_speedup_lat:.2f}x")